@@ -6,6 +6,10 @@ from typing import Any
 
 import yaml
 
+# LibYAML's C loader when the wheel ships it; the pure-Python SafeLoader
+# parses identically, an order of magnitude slower.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class PromptBundle:
@@ -28,6 +32,52 @@ def _read_text(path: Path) -> str:
     return path.read_text(encoding="utf-8").strip()
 
 
+# agent.yaml path -> (st_mtime_ns, parsed config). The file is parsed at
+# most once per change instead of once per bundle/component load.
+_AGENT_CONFIG_CACHE: dict[Path, tuple[int, dict[str, Any]]] = {}
+
+
+def _load_agent_config(agent_file: Path) -> dict[str, Any]:
+    mtime_ns = agent_file.stat().st_mtime_ns
+    cached = _AGENT_CONFIG_CACHE.get(agent_file)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    config: dict[str, Any] = yaml.load(agent_file.read_text(encoding="utf-8"), Loader=_YAML_LOADER) or {}
+    _AGENT_CONFIG_CACHE[agent_file] = (mtime_ns, config)
+    return config
+
+
+# Directory -> (mtime signature, components). Component files change rarely;
+# the signature (file names + mtime_ns) lets repeat calls skip re-reading
+# every markdown file while still picking up edits immediately.
+_COMPONENT_CACHE: dict[Path, tuple[tuple[tuple[str, int], ...], list[PromptComponent]]] = {}
+
+
+def _load_components_cached(components_dir: Path) -> list[PromptComponent]:
+    md_files = sorted(components_dir.glob("*.md"))
+    signature = tuple((f.name, f.stat().st_mtime_ns) for f in md_files)
+    cached = _COMPONENT_CACHE.get(components_dir)
+    if cached is not None and cached[0] == signature:
+        return list(cached[1])
+
+    components: list[PromptComponent] = []
+    for idx, md_file in enumerate(md_files):
+        text = _read_text(md_file)
+        components.append(
+            PromptComponent(
+                id=md_file.stem,
+                name=md_file.name,
+                file_path=str(md_file.resolve()),
+                content=text,
+                order=idx,
+                enabled=True,
+                is_system=True,
+            )
+        )
+    _COMPONENT_CACHE[components_dir] = (signature, components)
+    return list(components)
+
+
 def load_prompt_bundle(repo_root: Path, default_agent_id: str) -> PromptBundle:
     prompt_root = repo_root / "agent-prompts"
     agent_file = prompt_root / "basic" / "agent.yaml"
@@ -37,7 +87,7 @@ def load_prompt_bundle(repo_root: Path, default_agent_id: str) -> PromptBundle:
             system_prompt="You are a helpful local AI assistant.",
         )
 
-    config: dict[str, Any] = yaml.safe_load(agent_file.read_text(encoding="utf-8")) or {}
+    config = _load_agent_config(agent_file)
     agent_id = str(config.get("agent_id") or default_agent_id)
 
     persona_path = str(config.get("persona_prompt_set") or "agent-prompts/basic/components")
@@ -63,48 +113,19 @@ def load_prompt_components(repo_root: Path) -> list[PromptComponent]:
     if not agent_file.exists():
         return []
 
-    config: dict[str, Any] = yaml.safe_load(agent_file.read_text(encoding="utf-8")) or {}
+    config = _load_agent_config(agent_file)
     persona_path = str(config.get("persona_prompt_set") or "agent-prompts/basic/components")
     components_dir = repo_root / persona_path
     if not components_dir.exists():
         return []
-
-    components: list[PromptComponent] = []
-    for idx, md_file in enumerate(sorted(components_dir.glob("*.md"))):
-        text = _read_text(md_file)
-        components.append(
-            PromptComponent(
-                id=md_file.stem,
-                name=md_file.name,
-                file_path=str(md_file.resolve()),
-                content=text,
-                order=idx,
-                enabled=True,
-                is_system=True,
-            )
-        )
-    return components
+    return _load_components_cached(components_dir)
 
 
 def load_orchestrator_prompts(repo_root: Path) -> list[PromptComponent]:
     prompts_dir = repo_root / "agent-prompts" / "orchestrator"
     if not prompts_dir.exists():
         return []
-    components: list[PromptComponent] = []
-    for idx, md_file in enumerate(sorted(prompts_dir.glob("*.md"))):
-        text = _read_text(md_file)
-        components.append(
-            PromptComponent(
-                id=md_file.stem,
-                name=md_file.name,
-                file_path=str(md_file.resolve()),
-                content=text,
-                order=idx,
-                enabled=True,
-                is_system=True,
-            )
-        )
-    return components
+    return _load_components_cached(prompts_dir)
 
 
 def compose_system_prompt(components: list[PromptComponent]) -> str:
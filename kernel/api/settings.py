@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 import os
 
 
@@ -45,7 +46,14 @@ def _bool_env(name: str, default: bool) -> bool:
     return raw.strip().lower() in {"1", "true", "yes", "on"}
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    """Read the environment once and hand every caller the same instance.
+
+    Settings is frozen and the environment does not change under a running
+    process; modules that need a fresh read (tests mutating env vars) can
+    call ``get_settings.cache_clear()``.
+    """
     return Settings(
         aigent_version=os.getenv("AIGENT_VERSION", "0.3.0-oss"),
         aigent_tenant_id=os.getenv("AIGENT_TENANT_ID", "default"),
@@ -2,12 +2,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import json
 import os
 import sqlite3
-import uuid
+import time
 
+from kernel.shared.text import clip_preview
 
+
+@lru_cache(maxsize=1)
 def default_compaction_instructions() -> str:
     return (
         "If the conversation is approaching context limits, prioritize preserving the user's latest objective, "
@@ -16,18 +20,74 @@ def default_compaction_instructions() -> str:
     )
 
 
+@lru_cache(maxsize=8)
+def _rag_chunks_query(source_type_count: int) -> str:
+    query = (
+        "SELECT id, source_type, source_id, content, embedding, created_at"
+        " FROM rag_chunks"
+    )
+    if source_type_count:
+        placeholders = ",".join("?" for _ in range(source_type_count))
+        query += f" WHERE source_type IN ({placeholders})"
+    return query + " ORDER BY created_at DESC LIMIT ?"
+
+
+# Fallbacks for a tenant whose settings row does not exist yet; the API
+# and worker call sites pass their configured values instead.
+_DEFAULT_MAX_CONTEXT_TOKENS = 4096
+_DEFAULT_MAX_RESPONSE_TOKENS = 512
+_DEFAULT_COMPACT_TRIGGER_PCT = 0.9
+
+# How long cached profile/context metadata may serve reads. Other
+# processes share the database file, so only local writes invalidate
+# eagerly; the TTL bounds how stale a sibling process can be.
+_METADATA_CACHE_TTL_SECONDS = 5.0
+
+# Bump whenever _init_db gains a table, index, or column migration so
+# existing databases take the migration path exactly once.
+_SCHEMA_VERSION = 1
+
+
+def _new_id() -> str:
+    """Time-prefixed random id: 12 hex chars of epoch-ms plus 20 random.
+
+    Cheaper than uuid4's parse-and-format pass, and the leading timestamp
+    keeps primary keys roughly insert-ordered so the id B-tree appends
+    instead of splitting random interior pages. Consumers treat ids as
+    opaque strings, exactly as they did the hyphenated UUIDs.
+    """
+    return f"{time.time_ns() // 1_000_000:012x}{os.urandom(10).hex()}"
+
+
 def _utc_now_iso() -> str:
+    # Timestamps are stored as fixed-width UTC ISO-8601 TEXT. For a fixed
+    # offset that form sorts lexicographically in chronological order, so
+    # every ORDER BY / range predicate on created_at works on the string
+    # directly, and _utc_from_iso memoizes the parse on the read side.
     return datetime.now(timezone.utc).isoformat()
 
 
-def _utc_from_iso(value: str) -> datetime:
-    value = value.replace("\x00", "").strip()
-    if value.endswith("Z"):
-        value = value.replace("Z", "+00:00")
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
     return datetime.fromisoformat(value)
 
 
-@dataclass
+def _utc_from_iso(value: str) -> datetime:
+    # Hydration runs once per row on every list endpoint. Timestamps we
+    # wrote ourselves (_utc_now_iso) parse directly, and repeat heavily —
+    # rows written in one transaction share one timestamp — so the parse
+    # is memoized; datetime objects are immutable and safe to share. The
+    # sanitizing fallback handles legacy rows with NULs or a trailing Z.
+    try:
+        return _parse_iso(value)
+    except ValueError:
+        value = value.replace("\x00", "").strip()
+        if value.endswith("Z"):
+            value = value.replace("Z", "+00:00")
+        return _parse_iso(value)
+
+
+@dataclass(slots=True)
 class StoredMessage:
     id: str
     role: str
@@ -35,7 +95,7 @@ class StoredMessage:
     created_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class StoredConversation:
     id: str
     title: str
@@ -44,7 +104,7 @@ class StoredConversation:
     message_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class StoredInteractionEvent:
     id: str
     conversation_id: str
@@ -58,7 +118,7 @@ class StoredInteractionEvent:
     causation_event_id: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class StoredRagChunk:
     id: str
     source_type: str
@@ -68,7 +128,7 @@ class StoredRagChunk:
     embedding: list[float]
 
 
-@dataclass
+@dataclass(slots=True)
 class StoredRetrievedChunk:
     content: str
     score: float
@@ -77,7 +137,7 @@ class StoredRetrievedChunk:
     source_preview: str
 
 
-@dataclass
+@dataclass(slots=True)
 class StoredPerformanceExchange:
     id: str
     conversation_id: str
@@ -107,7 +167,7 @@ class StoredPerformanceExchange:
     assistant_tokens_est: int | None
 
 
-@dataclass
+@dataclass(slots=True)
 class StoredPromptProfile:
     id: str
     tenant_id: str
@@ -117,7 +177,7 @@ class StoredPromptProfile:
     updated_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class StoredContextSettings:
     tenant_id: str
     max_context_tokens: int
@@ -128,7 +188,7 @@ class StoredContextSettings:
     updated_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class StoredOrchestrationEvent:
     id: str
     conversation_id: str | None
@@ -144,7 +204,7 @@ class StoredOrchestrationEvent:
     error: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class StoredTurnContext:
     user_event_id: str
     conversation_id: str
@@ -156,7 +216,7 @@ class StoredTurnContext:
     updated_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class StoredDocumentImport:
     id: str
     conversation_id: str | None
@@ -170,7 +230,7 @@ class StoredDocumentImport:
     error: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class StoredMcpServer:
     id: str
     name: str
@@ -188,9 +248,28 @@ class StoredMcpServer:
 
 
 class ChatStore:
+    """SQLite-backed store shared by the API process and both workers.
+
+    Reads are served from the on-disk database through a generous page
+    cache and mmap window (see _create_connection) plus short-TTL
+    in-memory caches for per-request metadata; writes go straight to the
+    WAL. There is deliberately no in-memory replica: three processes
+    share this file, so any snapshot copy would immediately be stale for
+    writes made by a sibling.
+
+    Each process holds exactly one connection and uses it from one
+    thread, so there is no reader pool or dedicated writer connection
+    in-process; concurrency between the API and the workers is handled
+    by WAL, where readers never block the (single) writer.
+    """
+
     def __init__(self, db_path: str):
         self._db_path = db_path
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        # tenant_id -> (monotonic deadline, value). Read on every request,
+        # mutated rarely; see _METADATA_CACHE_TTL_SECONDS.
+        self._active_profile_cache: dict[str, tuple[float, StoredPromptProfile]] = {}
+        self._context_settings_cache: dict[str, tuple[float, StoredContextSettings]] = {}
         self._conn = self._create_connection()
         try:
             self._init_db()
@@ -201,17 +280,41 @@ class ChatStore:
             self._init_db()
 
     def _create_connection(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path, timeout=30, isolation_level=None)
+        # cached_statements above the 128 default: the store has well over
+        # a hundred distinct statements, and evicting a hot one forces a
+        # re-prepare of its VDBE program on the next call. This is the
+        # statement cache — per-request lookups such as the
+        # prompt_context_settings SELECT stay prepared for the life of the
+        # connection; there is no hand-rolled SQL->cursor cache on top.
+        #
+        # isolation_level=None puts the connection in autocommit: single
+        # statements commit themselves under WAL's group commit, and the
+        # few multi-statement sections open explicit BEGIN IMMEDIATE /
+        # COMMIT blocks where atomicity actually matters. There are no
+        # per-call Connection.commit() invocations anywhere in the store.
+        conn = sqlite3.connect(self._db_path, timeout=30, isolation_level=None, cached_statements=256)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA synchronous=NORMAL")
         conn.execute("PRAGMA foreign_keys=ON")
+        # Sort/temp b-trees in RAM, a 64 MiB page-cache budget, and mmap'd
+        # reads so hot pages come from the OS page cache without a copy.
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
         return conn
 
     @property
     def conn(self) -> sqlite3.Connection:
         return self._conn
 
+    def close(self) -> None:
+        """Close the shared connection; the store is unusable afterwards."""
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+
     def _rebuild_database_file(self) -> None:
         try:
             self._conn.close()
@@ -229,6 +332,12 @@ class ChatStore:
 
     def _init_db(self) -> None:
         with self._conn as conn:
+            # Stamped after the schema script and column migrations below
+            # have all run; a database already at the current version skips
+            # the DDL parse and the PRAGMA table_info round-trips entirely.
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= _SCHEMA_VERSION:
+                return
             conn.executescript(
                 """
                 CREATE TABLE IF NOT EXISTS conversations (
@@ -237,6 +346,7 @@ class ChatStore:
                     created_at TEXT NOT NULL,
                     updated_at TEXT NOT NULL,
                     message_count INTEGER NOT NULL DEFAULT 0,
+                    assistant_count INTEGER NOT NULL DEFAULT 0,
                     last_message_preview TEXT NOT NULL DEFAULT ''
                 );
 
@@ -305,11 +415,23 @@ class ChatStore:
                     FOREIGN KEY (conversation_id) REFERENCES conversations(id) ON DELETE CASCADE
                 );
 
+                CREATE INDEX IF NOT EXISTS idx_performance_exchanges_created
+                ON performance_exchanges(created_at DESC);
+
+                CREATE INDEX IF NOT EXISTS idx_performance_exchanges_conversation_created
+                ON performance_exchanges(conversation_id, created_at DESC);
+
                 CREATE TABLE IF NOT EXISTS worker_heartbeat (
                     worker_id TEXT PRIMARY KEY,
                     last_seen TEXT NOT NULL
                 );
 
+                CREATE TABLE IF NOT EXISTS baseline_jobs (
+                    id TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                );
+
                 CREATE TABLE IF NOT EXISTS prompt_profiles (
                     id TEXT PRIMARY KEY,
                     tenant_id TEXT NOT NULL,
@@ -320,6 +442,9 @@ class ChatStore:
                     updated_at TEXT NOT NULL
                 );
 
+                CREATE INDEX IF NOT EXISTS idx_prompt_profiles_tenant
+                ON prompt_profiles(tenant_id, is_active, is_default);
+
                 CREATE TABLE IF NOT EXISTS prompt_component_overrides (
                     id TEXT PRIMARY KEY,
                     profile_id TEXT NOT NULL,
@@ -391,6 +516,9 @@ class ChatStore:
                     FOREIGN KEY (conversation_id) REFERENCES conversations(id) ON DELETE CASCADE
                 );
 
+                CREATE INDEX IF NOT EXISTS idx_document_imports_conversation_created
+                ON document_imports(conversation_id, created_at DESC);
+
                 CREATE TABLE IF NOT EXISTS mcp_servers (
                     id TEXT PRIMARY KEY,
                     name TEXT NOT NULL,
@@ -414,6 +542,18 @@ class ChatStore:
             }
             if "message_count" not in convo_columns:
                 conn.execute("ALTER TABLE conversations ADD COLUMN message_count INTEGER NOT NULL DEFAULT 0")
+            if "assistant_count" not in convo_columns:
+                conn.execute("ALTER TABLE conversations ADD COLUMN assistant_count INTEGER NOT NULL DEFAULT 0")
+                conn.execute(
+                    """
+                    UPDATE conversations
+                    SET assistant_count = (
+                        SELECT COUNT(*) FROM interaction_events
+                        WHERE interaction_events.conversation_id = conversations.id
+                          AND interaction_events.role = 'assistant'
+                    )
+                    """
+                )
             if "last_message_preview" not in convo_columns:
                 conn.execute("ALTER TABLE conversations ADD COLUMN last_message_preview TEXT NOT NULL DEFAULT ''")
             columns = {
@@ -456,6 +596,21 @@ class ChatStore:
                 conn.execute(
                     "ALTER TABLE prompt_context_settings ADD COLUMN memory_enabled INTEGER NOT NULL DEFAULT 1"
                 )
+            # At most one default profile per tenant; also covers the
+            # tenant_id + is_default lookup in ensure_default_prompt_profile.
+            # Guarded separately from the schema script: a legacy database
+            # with duplicate defaults would raise IntegrityError, which must
+            # not be mistaken for corruption by the rebuild path in __init__.
+            try:
+                conn.execute(
+                    """
+                    CREATE UNIQUE INDEX IF NOT EXISTS uq_prompt_profiles_default
+                    ON prompt_profiles(tenant_id) WHERE is_default = 1
+                    """
+                )
+            except sqlite3.IntegrityError:
+                pass
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
 
     def _delete_rows_with_null_bytes(self, table: str, columns: list[str]) -> int:
         predicates = [f"substr(hex(COALESCE({column}, '')), 1, 2) = '00'" for column in columns]
@@ -510,7 +665,7 @@ class ChatStore:
                 conn.execute("ALTER TABLE mcp_servers ADD COLUMN discovered_tools TEXT NOT NULL DEFAULT '[]'")
 
     def create_conversation(self, title: str | None = None) -> tuple[str, datetime]:
-        conversation_id = str(uuid.uuid4())
+        conversation_id = _new_id()
         now = _utc_now_iso()
         with self._conn as conn:
             conn.execute(
@@ -526,11 +681,14 @@ class ChatStore:
 
     def maybe_set_title_from_message(self, conversation_id: str, user_message: str) -> None:
         with self._conn as conn:
-            row = conn.execute(
-                "SELECT COUNT(*) AS count FROM interaction_events WHERE conversation_id = ? AND role = 'user'",
+            # Only "is this the first user message?" matters, so LIMIT 2
+            # lets SQLite stop probing the index at the second hit instead
+            # of counting every user event in the conversation.
+            rows = conn.execute(
+                "SELECT 1 FROM interaction_events WHERE conversation_id = ? AND role = 'user' LIMIT 2",
                 (conversation_id,),
-            ).fetchone()
-            if row is None or int(row["count"]) > 1:
+            ).fetchall()
+            if len(rows) != 1:
                 return
             title = user_message.strip().replace("\n", " ")[:48] or "New Conversation"
             conn.execute("UPDATE conversations SET title = ? WHERE id = ?", (title, conversation_id))
@@ -557,7 +715,7 @@ class ChatStore:
         causation_event_id: str | None = None,
         error: str | None = None,
     ) -> StoredInteractionEvent:
-        event_id = str(uuid.uuid4())
+        event_id = _new_id()
         now = _utc_now_iso()
         processed_at = now if status in {"completed", "failed"} else None
         with self._conn as conn:
@@ -586,10 +744,11 @@ class ChatStore:
                     """
                     UPDATE conversations
                     SET updated_at = ?, message_count = message_count + 1,
+                        assistant_count = assistant_count + ?,
                         last_message_preview = ?
                     WHERE id = ?
                     """,
-                    (now, content.strip()[:160], conversation_id),
+                    (now, 1 if role == "assistant" else 0, clip_preview(content), conversation_id),
                 )
             else:
                 conn.execute("UPDATE conversations SET updated_at = ? WHERE id = ?", (now, conversation_id))
@@ -618,22 +777,43 @@ class ChatStore:
                 """,
                 (conversation_id,),
             ).fetchall()
+        # Positional unpacking in SELECT order: the by-name row lookup costs
+        # a keyed access per field per row, which shows up on this method —
+        # it runs on every worker poll and stream tick.
         return [
             StoredInteractionEvent(
-                id=row["id"],
-                conversation_id=row["conversation_id"],
-                role=row["role"],
-                event_type=row["event_type"],
-                content=row["content"],
-                status=row["status"],
-                created_at=_utc_from_iso(row["created_at"]),
-                processed_at=_utc_from_iso(row["processed_at"]) if row["processed_at"] else None,
-                error=row["error"],
-                causation_event_id=row["causation_event_id"],
+                id=event_id,
+                conversation_id=event_conversation_id,
+                role=role,
+                event_type=event_type,
+                content=content,
+                status=status,
+                created_at=_utc_from_iso(created_at),
+                processed_at=_utc_from_iso(processed_at) if processed_at else None,
+                error=error,
+                causation_event_id=causation_event_id,
             )
-            for row in rows
+            for (
+                event_id,
+                event_conversation_id,
+                role,
+                event_type,
+                content,
+                status,
+                created_at,
+                processed_at,
+                error,
+                causation_event_id,
+            ) in rows
         ]
 
+    def get_assistant_count(self, conversation_id: str) -> int:
+        row = self._conn.execute(
+            "SELECT assistant_count FROM conversations WHERE id = ?",
+            (conversation_id,),
+        ).fetchone()
+        return int(row["assistant_count"]) if row is not None else 0
+
     def get_messages(self, conversation_id: str) -> list[StoredMessage]:
         events = self.get_conversation_events(conversation_id)
         result: list[StoredMessage] = []
@@ -663,7 +843,7 @@ class ChatStore:
         payload: dict | None = None,
         error: str | None = None,
     ) -> StoredOrchestrationEvent:
-        event_id = str(uuid.uuid4())
+        event_id = _new_id()
         now = _utc_now_iso()
         processed_at = now if status in {"completed", "failed"} else None
         payload_json = json.dumps(payload or {})
@@ -949,7 +1129,7 @@ class ChatStore:
         conversation_id: str | None = None,
         file_hash: str | None = None,
     ) -> StoredDocumentImport:
-        doc_id = str(uuid.uuid4())
+        doc_id = _new_id()
         now = _utc_now_iso()
         with self._conn as conn:
             conn.execute(
@@ -1133,7 +1313,7 @@ class ChatStore:
         env: dict[str, str] | None = None,
         enabled: bool = True,
     ) -> StoredMcpServer:
-        server_id = str(uuid.uuid4())
+        server_id = _new_id()
         now = _utc_now_iso()
         status = "configured" if enabled else "disabled"
         args_payload = json.dumps(args or [])
@@ -1361,6 +1541,10 @@ class ChatStore:
         )
 
     def list_conversations(self) -> list[StoredConversation]:
+        # last_message_preview and message_count are denormalized onto the
+        # conversations row and maintained by create_interaction_event, so
+        # the listing is a single ordered scan with no per-conversation
+        # aggregate subqueries against interaction_events.
         conn = self._conn
         rows = conn.execute(
             """
@@ -1371,33 +1555,37 @@ class ChatStore:
         ).fetchall()
         return [
             StoredConversation(
-                id=row["id"],
-                title=row["title"],
-                updated_at=_utc_from_iso(row["updated_at"]),
-                last_message=row["last_message_preview"],
-                message_count=int(row["message_count"]),
+                id=conversation_id,
+                title=title,
+                updated_at=_utc_from_iso(updated_at),
+                last_message=last_message_preview,
+                message_count=int(message_count),
             )
-            for row in rows
+            for conversation_id, title, updated_at, last_message_preview, message_count in rows
         ]
 
     def delete_conversation(self, conversation_id: str) -> bool:
-        conn = self._conn
-        row = conn.execute("SELECT id FROM conversations WHERE id = ?", (conversation_id,)).fetchone()
-        if row is None:
-            return False
-        # rag_chunks aren't FK-linked to conversations, so delete manually.
-        conn.execute(
-            """
-            DELETE FROM rag_chunks
-            WHERE source_id IN (
-                SELECT id FROM interaction_events WHERE conversation_id = ?
+        # One transaction, two statements: the rag_chunks sweep (not
+        # FK-linked to conversations) and the conversations delete, whose
+        # RETURNING clause replaces the old existence pre-check. The
+        # interaction_events and performance_exchanges rows cascade.
+        with self._conn as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                """
+                DELETE FROM rag_chunks
+                WHERE source_id IN (
+                    SELECT id FROM interaction_events WHERE conversation_id = ?
+                )
+                """,
+                (conversation_id,),
             )
-            """,
-            (conversation_id,),
-        )
-        # interaction_events and performance_exchanges cascade from conversations.
-        conn.execute("DELETE FROM conversations WHERE id = ?", (conversation_id,))
-        return True
+            row = conn.execute(
+                "DELETE FROM conversations WHERE id = ? RETURNING id",
+                (conversation_id,),
+            ).fetchone()
+            conn.execute("COMMIT")
+        return row is not None
 
     def add_message(self, conversation_id: str, role: str, content: str) -> StoredMessage:
         event = self.create_interaction_event(conversation_id, role, content, status="completed")
@@ -1505,33 +1693,37 @@ class ChatStore:
         if row is not None:
             conn.execute(
                 "UPDATE conversations SET updated_at = ?, last_message_preview = ? WHERE id = ?",
-                (now, content.strip()[:160], row["conversation_id"]),
+                (now, clip_preview(content), row["conversation_id"]),
             )
 
     def upsert_rag_chunks(self, source_type: str, source_id: str, chunks: list[tuple[str, list[float]]]) -> None:
         now = _utc_now_iso()
+        rows = [
+            (_new_id(), source_type, source_id, content, json.dumps(embedding), now)
+            for content, embedding in chunks
+        ]
+        # One transaction and one executemany for the whole batch: the old
+        # per-chunk INSERT autocommitted, costing a WAL sync per chunk when
+        # a document import writes dozens of them.
         with self._conn as conn:
+            conn.execute("BEGIN IMMEDIATE")
             conn.execute("DELETE FROM rag_chunks WHERE source_type = ? AND source_id = ?", (source_type, source_id))
-            for content, embedding in chunks:
-                conn.execute(
+            if rows:
+                conn.executemany(
                     """
                     INSERT INTO rag_chunks(id, source_type, source_id, content, embedding, created_at)
                     VALUES (?, ?, ?, ?, ?, ?)
                     """,
-                    (str(uuid.uuid4()), source_type, source_id, content, json.dumps(embedding), now),
+                    rows,
                 )
+            conn.execute("COMMIT")
 
     def list_rag_chunks(self, limit: int = 500, source_types: list[str] | None = None) -> list[StoredRagChunk]:
-        query = """
-                SELECT id, source_type, source_id, content, embedding, created_at
-                FROM rag_chunks
-                """
-        params: list[object] = []
-        if source_types:
-            placeholders = ",".join("?" for _ in source_types)
-            query += f" WHERE source_type IN ({placeholders})"
-            params.extend(source_types)
-        query += " ORDER BY created_at DESC LIMIT ?"
+        # The query text is memoized per filter arity so repeat calls reuse
+        # one string object and hit sqlite3's statement cache instead of
+        # re-assembling (and re-preparing) the SQL each time.
+        query = _rag_chunks_query(len(source_types) if source_types else 0)
+        params: list[object] = list(source_types) if source_types else []
         params.append(limit)
         with self._conn as conn:
             rows = conn.execute(query, tuple(params)).fetchall()
@@ -1633,7 +1825,7 @@ class ChatStore:
         user_tokens_est: int | None,
         assistant_tokens_est: int | None,
     ) -> None:
-        exchange_id = str(uuid.uuid4())
+        exchange_id = _new_id()
         now = _utc_now_iso()
         with self._conn as conn:
             conn.execute(
@@ -1687,6 +1879,133 @@ class ChatStore:
                 ),
             )
 
+    def finalize_chat_exchange(
+        self,
+        *,
+        conversation_id: str,
+        user_event_id: str,
+        assistant_event_id: str,
+        assistant_content: str,
+        user_preview: str,
+        assistant_preview: str,
+        total_latency_ms: int,
+        llm_latency_ms: int,
+        ttft_ms: int | None,
+        prompt_tokens: int | None,
+        completion_tokens: int | None,
+        total_tokens: int | None,
+        response_source: str | None,
+        response_policy: str | None,
+        llm_involved: bool,
+        tool_observations: list[dict],
+        workflow_trace: list[dict],
+        retrieved_chunks: list[StoredRetrievedChunk],
+        system_chars: int,
+        user_chars: int,
+        assistant_chars: int,
+        system_tokens_est: int | None,
+        user_tokens_est: int | None,
+        assistant_tokens_est: int | None,
+    ) -> None:
+        """Apply every post-LLM write for one chat turn in a single transaction.
+
+        Completing the assistant event, completing the user event, queueing
+        the finalize_turn orchestration event, and recording the performance
+        exchange used to run as four separate autocommits — four WAL syncs
+        per turn. One BEGIN IMMEDIATE covers them all, and a reader never
+        observes a half-finalized turn.
+
+        Deliberately synchronous: the event pipeline treats row visibility
+        as the hand-off signal (workers poll for pending rows, the SSE
+        stream tails completed content), so deferring these writes to a
+        background queue would reorder the contract, not just the I/O.
+        """
+        exchange_id = _new_id()
+        orchestration_event_id = _new_id()
+        now = _utc_now_iso()
+        with self._conn as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                """
+                UPDATE interaction_events
+                SET content = ?, status = 'completed', processed_at = ?, error = NULL
+                WHERE id = ?
+                """,
+                (assistant_content, now, assistant_event_id),
+            )
+            conn.execute(
+                "UPDATE interaction_events SET status = 'completed', processed_at = ?, error = NULL WHERE id = ?",
+                (now, user_event_id),
+            )
+            conn.execute(
+                """
+                INSERT INTO orchestration_events(
+                    id, conversation_id, parent_event_id, document_id, event_type, label, detail,
+                    status, payload, created_at, processed_at, error
+                ) VALUES (?, ?, ?, NULL, 'finalize_turn', 'Writing memory', 'Queued post-turn orchestration',
+                          'pending', ?, ?, NULL, NULL)
+                """,
+                (
+                    orchestration_event_id,
+                    conversation_id,
+                    user_event_id,
+                    json.dumps({"assistant_event_id": assistant_event_id}),
+                    now,
+                ),
+            )
+            conn.execute("UPDATE conversations SET updated_at = ? WHERE id = ?", (now, conversation_id))
+            conn.execute(
+                """
+                INSERT INTO performance_exchanges(
+                    id, conversation_id, user_event_id, assistant_event_id, created_at, user_preview, assistant_preview,
+                    total_latency_ms, llm_latency_ms, ttft_ms, prompt_tokens, completion_tokens, total_tokens,
+                    response_source, response_policy, llm_involved, tool_observations, workflow_trace,
+                    retrieved_chunk_count, retrieved_chunks,
+                    system_chars, user_chars, assistant_chars, system_tokens_est, user_tokens_est, assistant_tokens_est
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    exchange_id,
+                    conversation_id,
+                    user_event_id,
+                    assistant_event_id,
+                    now,
+                    user_preview,
+                    assistant_preview,
+                    total_latency_ms,
+                    llm_latency_ms,
+                    ttft_ms,
+                    prompt_tokens,
+                    completion_tokens,
+                    total_tokens,
+                    response_source,
+                    response_policy,
+                    1 if llm_involved else 0,
+                    json.dumps(tool_observations),
+                    json.dumps(workflow_trace),
+                    len(retrieved_chunks),
+                    json.dumps(
+                        [
+                            {
+                                "content": chunk.content,
+                                "score": chunk.score,
+                                "source_id": chunk.source_id,
+                                "source_type": chunk.source_type,
+                                "source_preview": chunk.source_preview,
+                            }
+                            for chunk in retrieved_chunks
+                        ]
+                    ),
+                    system_chars,
+                    user_chars,
+                    assistant_chars,
+                    system_tokens_est,
+                    user_tokens_est,
+                    assistant_tokens_est,
+                ),
+            )
+            conn.execute("COMMIT")
+
     def list_recent_performance_exchanges(self, limit: int = 5) -> list[StoredPerformanceExchange]:
         with self._conn as conn:
             rows = conn.execute(
@@ -1861,53 +2180,65 @@ class ChatStore:
             assistant_tokens_est=row["assistant_tokens_est"],
         )
 
-    def _aggregate_tokens(self, since_iso: str | None = None) -> tuple[int, int, int, int]:
-        query = """
-            SELECT
-                COALESCE(SUM(total_tokens), 0) AS total_tokens,
-                COALESCE(SUM(prompt_tokens), 0) AS prompt_tokens,
-                COALESCE(SUM(completion_tokens), 0) AS completion_tokens,
-                COALESCE(COUNT(*), 0) AS exchange_count
-            FROM performance_exchanges
-        """
-        params: tuple = ()
-        if since_iso is not None:
-            query += " WHERE created_at >= ?"
-            params = (since_iso,)
-        with self._conn as conn:
-            row = conn.execute(query, params).fetchone()
-        return (
-            int(row["total_tokens"]),
-            int(row["prompt_tokens"]),
-            int(row["completion_tokens"]),
-            int(row["exchange_count"]),
-        )
-
     def summarize_performance(self) -> dict:
+        now = datetime.now(timezone.utc)
+        day_since = (now.replace(microsecond=0) - timedelta(days=1)).isoformat()
+        week_since = (now.replace(microsecond=0) - timedelta(days=7)).isoformat()
+        month_since = (now.replace(microsecond=0) - timedelta(days=30)).isoformat()
+        # One scan computes the latency stats and all four token windows;
+        # the old shape (one latency query plus one generic _aggregate_tokens
+        # call per window) walked performance_exchanges five times. The
+        # window-specific CASE sums below are that helper, specialized away.
         with self._conn as conn:
-            latency = conn.execute(
+            row = conn.execute(
                 """
                 SELECT
                     COALESCE(MIN(total_latency_ms), 0) AS min_latency,
                     COALESCE(MAX(total_latency_ms), 0) AS max_latency,
                     COALESCE(AVG(total_latency_ms), 0) AS avg_latency,
-                    COALESCE(COUNT(*), 0) AS exchange_count
+                    COUNT(*) AS exchange_count,
+                    COALESCE(SUM(CASE WHEN created_at >= :day THEN total_tokens END), 0) AS total_day,
+                    COALESCE(SUM(CASE WHEN created_at >= :day THEN prompt_tokens END), 0) AS prompt_day,
+                    COALESCE(SUM(CASE WHEN created_at >= :day THEN completion_tokens END), 0) AS completion_day,
+                    SUM(created_at >= :day) AS count_day,
+                    COALESCE(SUM(CASE WHEN created_at >= :week THEN total_tokens END), 0) AS total_week,
+                    COALESCE(SUM(CASE WHEN created_at >= :week THEN prompt_tokens END), 0) AS prompt_week,
+                    COALESCE(SUM(CASE WHEN created_at >= :week THEN completion_tokens END), 0) AS completion_week,
+                    SUM(created_at >= :week) AS count_week,
+                    COALESCE(SUM(CASE WHEN created_at >= :month THEN total_tokens END), 0) AS total_month,
+                    COALESCE(SUM(CASE WHEN created_at >= :month THEN prompt_tokens END), 0) AS prompt_month,
+                    COALESCE(SUM(CASE WHEN created_at >= :month THEN completion_tokens END), 0) AS completion_month,
+                    SUM(created_at >= :month) AS count_month,
+                    COALESCE(SUM(total_tokens), 0) AS total_all,
+                    COALESCE(SUM(prompt_tokens), 0) AS prompt_all,
+                    COALESCE(SUM(completion_tokens), 0) AS completion_all
                 FROM performance_exchanges
-                """
+                """,
+                {"day": day_since, "week": week_since, "month": month_since},
             ).fetchone()
-        now = datetime.now(timezone.utc)
-        day_since = (now.replace(microsecond=0) - timedelta(days=1)).isoformat()
-        week_since = (now.replace(microsecond=0) - timedelta(days=7)).isoformat()
-        month_since = (now.replace(microsecond=0) - timedelta(days=30)).isoformat()
+
+        def _window(suffix: str) -> tuple[int, int, int, int]:
+            return (
+                int(row[f"total_{suffix}"]),
+                int(row[f"prompt_{suffix}"]),
+                int(row[f"completion_{suffix}"]),
+                int(row[f"count_{suffix}"] or 0),
+            )
+
         return {
-            "latency_min_ms": int(latency["min_latency"]),
-            "latency_max_ms": int(latency["max_latency"]),
-            "latency_avg_ms": float(latency["avg_latency"] or 0),
-            "exchange_count": int(latency["exchange_count"]),
-            "tokens_day": self._aggregate_tokens(day_since),
-            "tokens_week": self._aggregate_tokens(week_since),
-            "tokens_month": self._aggregate_tokens(month_since),
-            "tokens_all_time": self._aggregate_tokens(None),
+            "latency_min_ms": int(row["min_latency"]),
+            "latency_max_ms": int(row["max_latency"]),
+            "latency_avg_ms": float(row["avg_latency"] or 0),
+            "exchange_count": int(row["exchange_count"]),
+            "tokens_day": _window("day"),
+            "tokens_week": _window("week"),
+            "tokens_month": _window("month"),
+            "tokens_all_time": (
+                int(row["total_all"]),
+                int(row["prompt_all"]),
+                int(row["completion_all"]),
+                int(row["exchange_count"]),
+            ),
         }
 
     def ensure_default_prompt_profile(self, tenant_id: str) -> StoredPromptProfile:
@@ -1933,7 +2264,7 @@ class ChatStore:
                     is_active=True,
                     updated_at=_utc_from_iso(existing["updated_at"]),
                 )
-            profile_id = str(uuid.uuid4())
+            profile_id = _new_id()
             now = _utc_now_iso()
             conn.execute(
                 """
@@ -1952,6 +2283,9 @@ class ChatStore:
         )
 
     def get_active_prompt_profile(self, tenant_id: str) -> StoredPromptProfile:
+        cached = self._active_profile_cache.get(tenant_id)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
         self.ensure_default_prompt_profile(tenant_id)
         with self._conn as conn:
             row = conn.execute(
@@ -1965,7 +2299,7 @@ class ChatStore:
             ).fetchone()
         if row is None:
             raise ValueError(f"No active prompt profile found for tenant '{tenant_id}'")
-        return StoredPromptProfile(
+        profile = StoredPromptProfile(
             id=row["id"],
             tenant_id=row["tenant_id"],
             name=row["name"],
@@ -1973,6 +2307,8 @@ class ChatStore:
             is_active=bool(row["is_active"]),
             updated_at=_utc_from_iso(row["updated_at"]),
         )
+        self._active_profile_cache[tenant_id] = (time.monotonic() + _METADATA_CACHE_TTL_SECONDS, profile)
+        return profile
 
     def list_prompt_profiles(self, tenant_id: str) -> list[StoredPromptProfile]:
         self.ensure_default_prompt_profile(tenant_id)
@@ -1999,7 +2335,7 @@ class ChatStore:
         ]
 
     def create_prompt_profile(self, tenant_id: str, name: str) -> StoredPromptProfile:
-        profile_id = str(uuid.uuid4())
+        profile_id = _new_id()
         now = _utc_now_iso()
         with self._conn as conn:
             conn.execute(
@@ -2029,6 +2365,7 @@ class ChatStore:
             now = _utc_now_iso()
             conn.execute("UPDATE prompt_profiles SET is_active = 0 WHERE tenant_id = ?", (tenant_id,))
             conn.execute("UPDATE prompt_profiles SET is_active = 1, updated_at = ? WHERE id = ?", (now, profile_id))
+        self._active_profile_cache.pop(tenant_id, None)
         return True
 
     def get_prompt_overrides(self, profile_id: str) -> dict[str, dict]:
@@ -2062,7 +2399,7 @@ class ChatStore:
                     INSERT INTO prompt_component_overrides(id, profile_id, component_id, content, enabled, updated_at)
                     VALUES (?, ?, ?, ?, ?, ?)
                     """,
-                    (str(uuid.uuid4()), profile_id, component_id, content, None if enabled is None else int(enabled), now),
+                    (_new_id(), profile_id, component_id, content, None if enabled is None else int(enabled), now),
                 )
             else:
                 conn.execute(
@@ -2076,12 +2413,16 @@ class ChatStore:
                     (content, None if enabled is None else int(enabled), now, profile_id, component_id),
                 )
             conn.execute("UPDATE prompt_profiles SET updated_at = ? WHERE id = ?", (now, profile_id))
+        # Only the profile id is known here; the cache is at most a few
+        # entries, so dropping it wholesale is the simple correct move.
+        self._active_profile_cache.clear()
 
     def reset_prompt_profile(self, profile_id: str) -> None:
         now = _utc_now_iso()
         with self._conn as conn:
             conn.execute("DELETE FROM prompt_component_overrides WHERE profile_id = ?", (profile_id,))
             conn.execute("UPDATE prompt_profiles SET updated_at = ? WHERE id = ?", (now, profile_id))
+        self._active_profile_cache.clear()
 
     def delete_all_data(self) -> None:
         conn = self._conn
@@ -2105,47 +2446,67 @@ class ChatStore:
         conn.execute("REINDEX")
         conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
         conn.execute("VACUUM")
+        self._active_profile_cache.clear()
+        self._context_settings_cache.clear()
+
+    # Section name -> (query, tenant-scoped). Ordering matters only for
+    # readability of the exported document.
+    _EXPORT_SECTIONS: tuple[tuple[str, str, bool], ...] = (
+        ("conversations", "SELECT * FROM conversations ORDER BY created_at ASC", False),
+        ("interaction_events", "SELECT * FROM interaction_events ORDER BY created_at ASC", False),
+        ("orchestration_events", "SELECT * FROM orchestration_events ORDER BY created_at ASC", False),
+        ("turn_contexts", "SELECT * FROM turn_contexts ORDER BY created_at ASC", False),
+        ("document_imports", "SELECT * FROM document_imports ORDER BY created_at ASC", False),
+        ("mcp_servers", "SELECT * FROM mcp_servers ORDER BY created_at ASC", False),
+        ("rag_chunks", "SELECT * FROM rag_chunks ORDER BY created_at ASC", False),
+        ("performance_exchanges", "SELECT * FROM performance_exchanges ORDER BY created_at ASC", False),
+        ("prompt_profiles", "SELECT * FROM prompt_profiles WHERE tenant_id = ? ORDER BY created_at ASC", True),
+        (
+            "prompt_component_overrides",
+            """
+            SELECT o.id, o.profile_id, o.component_id, o.content, o.enabled, o.updated_at
+            FROM prompt_component_overrides o
+            INNER JOIN prompt_profiles p ON p.id = o.profile_id
+            WHERE p.tenant_id = ?
+            ORDER BY o.updated_at ASC
+            """,
+            True,
+        ),
+    )
+
+    def _iter_rows(self, query: str, params: tuple = ()):
+        """Yield rows as dicts in fetchmany batches.
+
+        The column tuple is bound once so per-row conversion is a zip
+        instead of re-hashing column names for every sqlite3.Row.
+        """
+        cursor = self._conn.execute(query, params)
+        columns = tuple(description[0] for description in cursor.description)
+        while True:
+            batch = cursor.fetchmany(1000)
+            if not batch:
+                return
+            for row in batch:
+                yield dict(zip(columns, row))
+
+    def iter_export_sections(self, tenant_id: str):
+        """Yield (section name, row iterator) pairs for a tenant export."""
+        for name, query, tenant_scoped in self._EXPORT_SECTIONS:
+            yield name, self._iter_rows(query, (tenant_id,) if tenant_scoped else ())
+
+    def get_export_context_settings(self, tenant_id: str) -> dict | None:
+        row = self._conn.execute(
+            "SELECT * FROM prompt_context_settings WHERE tenant_id = ?", (tenant_id,)
+        ).fetchone()
+        return dict(row) if row is not None else None
 
     def export_all_data(self, tenant_id: str) -> dict:
-        with self._conn as conn:
-            conversations = [dict(row) for row in conn.execute("SELECT * FROM conversations ORDER BY created_at ASC").fetchall()]
-            events = [dict(row) for row in conn.execute("SELECT * FROM interaction_events ORDER BY created_at ASC").fetchall()]
-            orchestration_events = [dict(row) for row in conn.execute("SELECT * FROM orchestration_events ORDER BY created_at ASC").fetchall()]
-            turn_contexts = [dict(row) for row in conn.execute("SELECT * FROM turn_contexts ORDER BY created_at ASC").fetchall()]
-            document_imports = [dict(row) for row in conn.execute("SELECT * FROM document_imports ORDER BY created_at ASC").fetchall()]
-            mcp_servers = [dict(row) for row in conn.execute("SELECT * FROM mcp_servers ORDER BY created_at ASC").fetchall()]
-            chunks = [dict(row) for row in conn.execute("SELECT * FROM rag_chunks ORDER BY created_at ASC").fetchall()]
-            performance = [dict(row) for row in conn.execute("SELECT * FROM performance_exchanges ORDER BY created_at ASC").fetchall()]
-            prompt_profiles = [dict(row) for row in conn.execute("SELECT * FROM prompt_profiles WHERE tenant_id = ? ORDER BY created_at ASC", (tenant_id,)).fetchall()]
-            prompt_overrides = [
-                dict(row)
-                for row in conn.execute(
-                    """
-                    SELECT o.id, o.profile_id, o.component_id, o.content, o.enabled, o.updated_at
-                    FROM prompt_component_overrides o
-                    INNER JOIN prompt_profiles p ON p.id = o.profile_id
-                    WHERE p.tenant_id = ?
-                    ORDER BY o.updated_at ASC
-                    """,
-                    (tenant_id,),
-                ).fetchall()
-            ]
-            context_settings = conn.execute("SELECT * FROM prompt_context_settings WHERE tenant_id = ?", (tenant_id,)).fetchone()
-        return {
-            "tenant_id": tenant_id,
-            "exported_at": _utc_now_iso(),
-            "conversations": conversations,
-            "interaction_events": events,
-            "orchestration_events": orchestration_events,
-            "turn_contexts": turn_contexts,
-            "document_imports": document_imports,
-            "mcp_servers": mcp_servers,
-            "rag_chunks": chunks,
-            "performance_exchanges": performance,
-            "prompt_profiles": prompt_profiles,
-            "prompt_component_overrides": prompt_overrides,
-            "prompt_context_settings": dict(context_settings) if context_settings is not None else None,
-        }
+        """Materialized export; prefer iter_export_sections for streaming."""
+        data: dict = {"tenant_id": tenant_id, "exported_at": _utc_now_iso()}
+        for name, rows in self.iter_export_sections(tenant_id):
+            data[name] = list(rows)
+        data["prompt_context_settings"] = self.get_export_context_settings(tenant_id)
+        return data
 
     def ensure_context_settings(
         self,
@@ -2154,6 +2515,9 @@ class ChatStore:
         max_response_tokens: int,
         compact_trigger_pct: float,
     ) -> StoredContextSettings:
+        cached = self._context_settings_cache.get(tenant_id)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
         with self._conn as conn:
             row = conn.execute(
                 """
@@ -2180,7 +2544,7 @@ class ChatStore:
                         now,
                     ),
                 )
-                return StoredContextSettings(
+                settings = StoredContextSettings(
                     tenant_id=tenant_id,
                     max_context_tokens=max_context_tokens,
                     max_response_tokens=max_response_tokens,
@@ -2189,16 +2553,24 @@ class ChatStore:
                     memory_enabled=True,
                     updated_at=_utc_from_iso(now),
                 )
-            compact_instructions = str(row["compact_instructions"] or "").strip() or default_compaction_instructions()
-            return StoredContextSettings(
-                tenant_id=row["tenant_id"],
-                max_context_tokens=int(row["max_context_tokens"]),
-                max_response_tokens=int(row["max_response_tokens"]),
-                compact_trigger_pct=float(row["compact_trigger_pct"]),
-                compact_instructions=compact_instructions,
-                memory_enabled=bool(row["memory_enabled"]),
-                updated_at=_utc_from_iso(row["updated_at"]),
-            )
+            else:
+                # Positional unpack in SELECT order; keyed Row access pays a
+                # name lookup per column.
+                row_tenant_id, row_mct, row_mrt, row_pct, row_instructions, row_memory, row_updated = row
+                settings = StoredContextSettings(
+                    tenant_id=row_tenant_id,
+                    max_context_tokens=int(row_mct),
+                    max_response_tokens=int(row_mrt),
+                    compact_trigger_pct=float(row_pct),
+                    # Empty instructions fall back to the default in Python;
+                    # deliberately no write-back UPDATE here, so a read with
+                    # a blank row stays a read.
+                    compact_instructions=str(row_instructions or "").strip() or default_compaction_instructions(),
+                    memory_enabled=bool(row_memory),
+                    updated_at=_utc_from_iso(row_updated),
+                )
+        self._context_settings_cache[tenant_id] = (time.monotonic() + _METADATA_CACHE_TTL_SECONDS, settings)
+        return settings
 
     def update_context_settings(
         self,
@@ -2209,31 +2581,88 @@ class ChatStore:
         compact_instructions: str | None = None,
         memory_enabled: bool | None = None,
     ) -> StoredContextSettings:
-        current = self.ensure_context_settings(tenant_id, 4096, 512, 0.9)
+        # ensure supplies current values for any argument left as None; it
+        # is usually a cache hit. The write itself is one upsert whose
+        # RETURNING row becomes the response, so the whole update is a
+        # single statement instead of UPDATE plus a re-read.
+        current = self.ensure_context_settings(
+            tenant_id,
+            _DEFAULT_MAX_CONTEXT_TOKENS,
+            _DEFAULT_MAX_RESPONSE_TOKENS,
+            _DEFAULT_COMPACT_TRIGGER_PCT,
+        )
         now = _utc_now_iso()
         with self._conn as conn:
-            conn.execute(
+            row = conn.execute(
                 """
-                UPDATE prompt_context_settings
-                SET max_context_tokens = ?,
-                    max_response_tokens = ?,
-                    compact_trigger_pct = ?,
-                    compact_instructions = ?,
-                    memory_enabled = ?,
-                    updated_at = ?
-                WHERE tenant_id = ?
+                INSERT INTO prompt_context_settings(tenant_id, max_context_tokens, max_response_tokens, compact_trigger_pct, compact_instructions, memory_enabled, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(tenant_id) DO UPDATE SET
+                    max_context_tokens = excluded.max_context_tokens,
+                    max_response_tokens = excluded.max_response_tokens,
+                    compact_trigger_pct = excluded.compact_trigger_pct,
+                    compact_instructions = excluded.compact_instructions,
+                    memory_enabled = excluded.memory_enabled,
+                    updated_at = excluded.updated_at
+                RETURNING tenant_id, max_context_tokens, max_response_tokens, compact_trigger_pct, compact_instructions, memory_enabled, updated_at
                 """,
                 (
+                    tenant_id,
                     int(max_context_tokens if max_context_tokens is not None else current.max_context_tokens),
                     int(max_response_tokens if max_response_tokens is not None else current.max_response_tokens),
                     float(compact_trigger_pct if compact_trigger_pct is not None else current.compact_trigger_pct),
                     str(compact_instructions if compact_instructions is not None else current.compact_instructions),
                     int(memory_enabled if memory_enabled is not None else current.memory_enabled),
                     now,
-                    tenant_id,
                 ),
+            ).fetchone()
+        row_tenant_id, row_mct, row_mrt, row_pct, row_instructions, row_memory, row_updated = row
+        settings = StoredContextSettings(
+            tenant_id=row_tenant_id,
+            max_context_tokens=int(row_mct),
+            max_response_tokens=int(row_mrt),
+            compact_trigger_pct=float(row_pct),
+            compact_instructions=str(row_instructions or "").strip() or default_compaction_instructions(),
+            memory_enabled=bool(row_memory),
+            updated_at=_utc_from_iso(row_updated),
+        )
+        # Write-through: the RETURNING row is the freshest possible value,
+        # so cache it directly rather than invalidating and re-reading. The
+        # usual TTL still bounds staleness for sibling processes.
+        self._context_settings_cache[tenant_id] = (time.monotonic() + _METADATA_CACHE_TTL_SECONDS, settings)
+        return settings
+
+    def upsert_baseline_job(self, job_id: str, payload: dict) -> None:
+        """Persist a JSON snapshot of a baseline job's status.
+
+        Keeps job status visible across process restarts and across uvicorn
+        workers; the in-process dict stays the hot path for the worker that
+        owns the running job.
+        """
+        now = _utc_now_iso()
+        with self._conn as conn:
+            conn.execute(
+                """
+                INSERT INTO baseline_jobs(id, payload, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET payload = excluded.payload, updated_at = excluded.updated_at
+                """,
+                (job_id, json.dumps(payload), now),
+            )
+
+    def get_baseline_job(self, job_id: str) -> dict | None:
+        row = self._conn.execute(
+            "SELECT payload FROM baseline_jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row["payload"])
+
+    def prune_baseline_jobs(self, older_than: datetime) -> None:
+        with self._conn as conn:
+            conn.execute(
+                "DELETE FROM baseline_jobs WHERE updated_at < ?",
+                (older_than.isoformat(),),
             )
-        return self.ensure_context_settings(tenant_id, 4096, 512, 0.9)
 
     def update_worker_heartbeat(self, worker_id: str = "dialogue-worker") -> None:
         now = _utc_now_iso()
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import math
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -10,11 +9,17 @@ if TYPE_CHECKING:
 def estimate_tokens_for_messages(messages: list[ChatMessageIn]) -> int:
     # TODO: char/4 is a rough heuristic (~3.5 for SmolLM3 English).
     # Consider using Ollama's /api/tokenize endpoint for accuracy.
-    return max(1, math.ceil(sum(len(m.content or "") for m in messages) / 4))
+    # (total + 3) // 4 is ceil(total / 4) in pure int arithmetic.
+    total = 0
+    for m in messages:
+        content = m.content
+        if content:
+            total += len(content)
+    return max(1, (total + 3) // 4)
 
 
 def estimate_tokens_for_text(text: str) -> int:
-    return max(1, math.ceil(len(text or "") / 4))
+    return max(1, (len(text) + 3) // 4) if text else 1
 
 
 def allocate_estimated_tokens(
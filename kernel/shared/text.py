@@ -3,6 +3,9 @@ from __future__ import annotations
 import math
 import re
 
+_THINK_BLOCK_RE = re.compile(r"<think>[\s\S]*?</think>", re.IGNORECASE)
+_THINK_TAG_RE = re.compile(r"</?think>", re.IGNORECASE)
+
 
 def chunk_text(text: str, max_chars: int = 500) -> list[str]:
     """Split text into word-boundary chunks of at most *max_chars* characters."""
@@ -44,11 +47,29 @@ def cosine_similarity(left: list[float], right: list[float]) -> float:
 
 def extract_visible_text(text: str) -> str:
     """Strip ``<think>...</think>`` blocks from model output."""
-    no_think = re.sub(r"<think>[\s\S]*?</think>", "", text or "", flags=re.IGNORECASE)
-    no_tags = re.sub(r"</?think>", "", no_think, flags=re.IGNORECASE)
+    if not text:
+        return ""
+    # Most models never emit think tags; a substring probe is far cheaper
+    # than two full regex passes over the body. Probe the lowercased text
+    # so the shortcut matches the regexes' IGNORECASE semantics.
+    lowered = text.lower()
+    if "<think" not in lowered and "</think" not in lowered:
+        return text.strip()
+    no_think = _THINK_BLOCK_RE.sub("", text)
+    no_tags = _THINK_TAG_RE.sub("", no_think)
     return no_tags.strip()
 
 
+def clip_preview(text: str, max_chars: int = 160) -> str:
+    """Bounded preview of *text* without stripping the whole string first.
+
+    ``text.strip()[:160]`` copies the entire (possibly multi-kilobyte)
+    string to keep 160 characters; slicing a 2x window first bounds the
+    copy while leaving room for leading whitespace to strip away.
+    """
+    return text[: max_chars * 2].strip()[:max_chars]
+
+
 def preview_text(text: str, max_chars: int = 120) -> str:
     cleaned = " ".join((text or "").split()).strip()
     if len(cleaned) <= max_chars:
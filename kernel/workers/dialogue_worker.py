@@ -12,8 +12,8 @@ from kernel.api.llm import ChatMessageIn, OllamaClient, OllamaEmbeddingClient
 from kernel.api.prompts import compose_system_prompt, load_prompt_components
 from kernel.api.settings import get_settings
 from kernel.api.storage import ChatStore, StoredInteractionEvent, StoredRetrievedChunk
-from kernel.shared.metrics import estimate_tokens_for_messages, allocate_estimated_tokens
-from kernel.shared.text import cosine_similarity, preview_text
+from kernel.shared.metrics import estimate_tokens_for_text, allocate_estimated_tokens
+from kernel.shared.text import clip_preview, cosine_similarity, preview_text
 
 
 settings = get_settings()
@@ -85,28 +85,46 @@ async def _retrieve_context_chunks(
     return scored[:limit]
 
 
-def _conversation_history_messages(conversation_id: str, current_event_id: str) -> list[ChatMessageIn]:
-    events = store.get_conversation_events(conversation_id)
-    history: list[ChatMessageIn] = []
-    for event in events:
-        if event.id == current_event_id:
-            continue
-        if event.role not in {"user", "assistant"}:
-            continue
-        if event.status != "completed":
-            continue
-        history.append(ChatMessageIn(role=event.role, content=event.content))
-    return history
+def _append_history_messages(dest: list[ChatMessageIn], conversation_id: str, current_event_id: str) -> None:
+    """Append completed user/assistant turns directly into *dest*.
+
+    Appending in place avoids building an intermediate history list that
+    the caller would immediately copy into the LLM message list.
+    """
+    append = dest.append
+    for event in store.get_conversation_events(conversation_id):
+        if (
+            event.id != current_event_id
+            and event.status == "completed"
+            and event.role in {"user", "assistant"}
+        ):
+            append(ChatMessageIn(role=event.role, content=event.content))
 
 
 def _apply_context_window(messages: list[ChatMessageIn], max_context_tokens: int, compact_instructions: str, compact_trigger_pct: float) -> list[ChatMessageIn]:
-    est_prompt_tokens_before = estimate_tokens_for_messages(messages)
+    # One walk collects the per-message character counts; everything else
+    # (the pre-compaction estimate, the compact trigger, the drop loop) is
+    # maintained incrementally from that single pass. max(1, (chars+3)//4)
+    # matches estimate_tokens_for_messages exactly.
+    char_counts = [len(m.content or "") for m in messages]
+    total_chars = sum(char_counts)
+    est_prompt_tokens_before = max(1, (total_chars + 3) // 4)
     compact_threshold = int(max_context_tokens * compact_trigger_pct)
     result = list(messages)
-    if compact_instructions.strip() and est_prompt_tokens_before >= compact_threshold:
-        result.insert(1, ChatMessageIn(role="system", content=compact_instructions.strip()))
-    while len(result) > 3 and estimate_tokens_for_messages(result) > max_context_tokens:
-        result.pop(2)
+    compact_text = compact_instructions.strip()
+    if compact_text and est_prompt_tokens_before >= compact_threshold:
+        result.insert(1, ChatMessageIn(role="system", content=compact_text))
+        char_counts.insert(1, len(compact_text))
+        total_chars += len(compact_text)
+    # Drops decrement the running total instead of re-estimating the whole
+    # list: repeated pop(2) plus a full re-scan is O(n^2) on long
+    # histories. The survivors are spliced out in a single slice.
+    dropped = 0
+    while len(result) - dropped > 3 and max(1, (total_chars + 3) // 4) > max_context_tokens:
+        total_chars -= char_counts[2 + dropped]
+        dropped += 1
+    if dropped:
+        result = [*result[:2], *result[2 + dropped:]]
     return result
 
 
@@ -309,8 +327,6 @@ async def _process_event(event: StoredInteractionEvent) -> None:
 
     tool_observations: list[dict] = context.tool_observations
 
-    history_messages = _conversation_history_messages(event.conversation_id, event.id)
-
     llm_messages: list[ChatMessageIn] = [ChatMessageIn(role="system", content=effective_prompt)]
     if retrieved_chunks:
         llm_messages.append(
@@ -332,7 +348,7 @@ async def _process_event(event: StoredInteractionEvent) -> None:
     recent_document_context = _recent_document_context(event.conversation_id, event.content)
     if recent_document_context:
         llm_messages.append(ChatMessageIn(role="system", content=recent_document_context))
-    llm_messages.extend(history_messages)
+    _append_history_messages(llm_messages, event.conversation_id, event.id)
     llm_messages.append(ChatMessageIn(role="user", content=event.content))
     llm_messages = _apply_context_window(
         llm_messages,
@@ -341,9 +357,16 @@ async def _process_event(event: StoredInteractionEvent) -> None:
         context_settings.compact_trigger_pct,
     )
 
-    system_chars = sum(len(m.content) for m in llm_messages if m.role == "system")
-    user_chars = sum(len(m.content) for m in llm_messages if m.role == "user")
-    assistant_chars = sum(len(m.content) for m in llm_messages if m.role == "assistant")
+    system_chars = 0
+    user_chars = 0
+    assistant_chars = 0
+    for m in llm_messages:
+        if m.role == "system":
+            system_chars += len(m.content)
+        elif m.role == "user":
+            user_chars += len(m.content)
+        elif m.role == "assistant":
+            assistant_chars += len(m.content)
 
     assistant_event = store.create_interaction_event(
         conversation_id=event.conversation_id,
@@ -374,9 +397,7 @@ async def _process_event(event: StoredInteractionEvent) -> None:
             completion_latency_ms = 0
             completion_ttft_ms = 0
             completion_prompt_tokens = None
-            completion_completion_tokens = estimate_tokens_for_messages(
-                [ChatMessageIn(role="assistant", content=direct_tool_response)]
-            )
+            completion_completion_tokens = estimate_tokens_for_text(direct_tool_response)
             completion_total_tokens = completion_completion_tokens
         else:
             completion = await llm_client.chat(
@@ -398,30 +419,21 @@ async def _process_event(event: StoredInteractionEvent) -> None:
         raise
     total_latency_ms = int((time.perf_counter() - started) * 1000)
 
-    store.mark_event_completed_with_content(assistant_event.id, completion_content)
-    store.mark_event_completed(event.id)
-    store.create_orchestration_event(
-        event_type="finalize_turn",
-        label="Writing memory",
-        detail="Queued post-turn orchestration",
-        status="pending",
-        conversation_id=event.conversation_id,
-        parent_event_id=event.id,
-        payload={"assistant_event_id": assistant_event.id},
-    )
-
     system_tokens_est, user_tokens_est, assistant_tokens_est = allocate_estimated_tokens(
         completion_prompt_tokens,
         system_chars,
         user_chars,
         assistant_chars,
     )
-    store.add_performance_exchange(
+    # One transaction covers event completion, the finalize_turn
+    # orchestration event, and the performance exchange row.
+    store.finalize_chat_exchange(
         conversation_id=event.conversation_id,
         user_event_id=event.id,
         assistant_event_id=assistant_event.id,
-        user_preview=event.content.strip()[:160],
-        assistant_preview=completion_content.strip()[:160],
+        assistant_content=completion_content,
+        user_preview=clip_preview(event.content),
+        assistant_preview=clip_preview(completion_content),
         total_latency_ms=total_latency_ms,
         llm_latency_ms=completion_latency_ms,
         ttft_ms=completion_ttft_ms,
@@ -18,7 +18,7 @@ from kernel.api.storage import (
     StoredOrchestrationEvent,
 )
 from kernel.shared.metrics import allocate_estimated_tokens, estimate_tokens_for_messages
-from kernel.shared.text import chunk_text, extract_visible_text, preview_text
+from kernel.shared.text import chunk_text, clip_preview, extract_visible_text, preview_text
 
 
 settings = get_settings()
@@ -689,8 +689,8 @@ async def _complete_tool_routed_turn(
         conversation_id=user_event.conversation_id,
         user_event_id=user_event.id,
         assistant_event_id=assistant_event.id,
-        user_preview=user_event.content.strip()[:160],
-        assistant_preview=completion_content.strip()[:160],
+        user_preview=clip_preview(user_event.content),
+        assistant_preview=clip_preview(completion_content),
         total_latency_ms=llm_latency_ms,
         llm_latency_ms=llm_latency_ms,
         ttft_ms=ttft_ms,
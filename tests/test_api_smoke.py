@@ -34,7 +34,11 @@ Two implementation notes:
 
 from __future__ import annotations
 
+import asyncio
+import json
 import os
+from collections import deque
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 import pytest
@@ -77,6 +81,12 @@ def api_app(tmp_path_factory):
     os.environ["AIGENT_VERSION"] = "test-version"
     os.environ["AIGENT_TENANT_ID"] = "test-tenant"
 
+    # Collection of other test modules may already have populated the
+    # memoized get_settings(); drop it so the overrides above are read.
+    from kernel.api.settings import get_settings
+
+    get_settings.cache_clear()
+
     from kernel.api import main as api_main  # noqa: WPS433 (late import is intentional)
 
     return api_main.app, api_main.store, api_main.settings
@@ -215,3 +225,189 @@ async def test_delete_all_data_endpoint_requires_confirmation_and_clears_state(a
 
         cleared = await client.get("/api/conversations")
         assert cleared.json() == []
+
+
+async def _next_sse_frame(frames) -> tuple[str, str]:
+    """Read one ``event:``/``data:`` frame from an SSE chunk iterator."""
+    buffered = ""
+    async for chunk in frames:
+        buffered += chunk
+        if "\n\n" in buffered:
+            frame, _, _rest = buffered.partition("\n\n")
+            event = None
+            data = None
+            for line in frame.splitlines():
+                if line.startswith("event:"):
+                    event = line.split(":", 1)[1].strip()
+                elif line.startswith("data:"):
+                    data = line.split(":", 1)[1].strip()
+            assert event is not None
+            return event, data
+    raise AssertionError("SSE stream ended before a complete frame arrived")
+
+
+@pytest.mark.p0
+@pytest.mark.anyio
+async def test_chat_stream_emits_accepted_delta_done_frames(api_context):
+    """``GET /api/chat/stream`` frames: ``accepted``, ``delta``, ``done``.
+
+    Scenario: no dialogue worker runs in tests, so the test plays the
+    worker's part — after the stream's ``accepted`` frame arrives it
+    writes an assistant event causally linked to the accepted user event,
+    then completes it with more content, and asserts the stream tails
+    those writes as incremental ``delta`` frames followed by ``done``.
+
+    The handler's StreamingResponse generator is consumed directly:
+    the pinned httpx version buffers ASGI responses in full, so an
+    open-ended SSE body cannot be read through the transport.
+
+    Why it matters: the WebUI's streaming chat path consumes exactly
+    these frames via EventSource; a renamed event or reshaped payload
+    breaks it silently.
+    """
+    from kernel.api import main as api_main
+
+    _app, store, _settings = api_context
+
+    response = await api_main.chat_stream(message="stream hello")
+    assert response.media_type == "text/event-stream"
+    frames = response.body_iterator
+
+    event, data = await _next_sse_frame(frames)
+    assert event == "accepted"
+    accepted = json.loads(data)
+    conversation_id = accepted["conversation_id"]
+    assert store.ensure_conversation(conversation_id)
+
+    assistant = store.create_interaction_event(
+        conversation_id,
+        "assistant",
+        "Hel",
+        status="processing",
+        causation_event_id=accepted["event_id"],
+    )
+    event, data = await _next_sse_frame(frames)
+    assert event == "delta"
+    assert json.loads(data)["delta"] == "Hel"
+
+    store.mark_event_completed_with_content(assistant.id, "Hello!")
+    event, data = await _next_sse_frame(frames)
+    assert event == "delta"
+    assert json.loads(data)["delta"] == "lo!"
+
+    event, data = await _next_sse_frame(frames)
+    assert event == "done"
+    done = json.loads(data)
+    assert done["event_id"] == assistant.id
+    assert done["content_chars"] == len("Hello!")
+
+
+def _seed_baseline_job(api_main, job_id: str, status: str) -> dict:
+    """Install a minimal baseline job dict the stream endpoints can serve."""
+    now = datetime.now(timezone.utc)
+    job = {
+        "status": status,
+        "model": "test-model",
+        "total_calls": 2,
+        "completed_calls": 0,
+        "current_step": "Running",
+        "started_at": now,
+        "updated_at": now,
+        "completed_at": None,
+        "duration_ms": None,
+        "events": deque(["Baseline run started"], maxlen=100),
+        "status_event": asyncio.Event(),
+        "case_listeners": [],
+        "completed_cases": [],
+        "error": None,
+        "result": None,
+    }
+    api_main._baseline_jobs[job_id] = job
+    return job
+
+
+def _baseline_case(api_main, case_id: str):
+    return api_main.BaselineCaseResult(
+        id=case_id,
+        label=case_id,
+        calls=1,
+        input_tokens_est=10,
+        ttft_ms=3,
+        prompt_tokens=10,
+        completion_tokens=5,
+        total_tokens=15,
+        total_latency_ms=7,
+        avg_latency_ms=7.0,
+        min_latency_ms=7,
+        max_latency_ms=7,
+        completion_time_ms=7,
+    )
+
+
+@pytest.mark.anyio
+async def test_baseline_case_stream_broadcasts_and_replays(api_context):
+    """The NDJSON case stream serves every listener the full run.
+
+    Scenario: a running job has one case finished before anyone listens.
+    Two listeners then connect concurrently; both must first replay the
+    missed case, then each receive the case published while they are
+    attached, then the final status line once the job completes.
+
+    Why it matters: the stream used to be one shared queue drained
+    destructively, which handed concurrent listeners disjoint subsets.
+    """
+    from kernel.api import main as api_main
+
+    _app, _store, _settings = api_context
+    job_id = "test-case-stream-job"
+    job = _seed_baseline_job(api_main, job_id, status="running")
+    api_main._publish_baseline_case(job_id, _baseline_case(api_main, "case_one"))
+    try:
+        first = (await api_main.stream_baseline_cases(job_id)).body_iterator
+        second = (await api_main.stream_baseline_cases(job_id)).body_iterator
+
+        assert json.loads(await anext(first))["id"] == "case_one"
+        assert json.loads(await anext(second))["id"] == "case_one"
+        assert len(job["case_listeners"]) == 2
+
+        api_main._publish_baseline_case(job_id, _baseline_case(api_main, "case_two"))
+        job["status"] = "completed"
+        api_main._close_baseline_stream(job_id)
+
+        for lines in (first, second):
+            assert json.loads(await anext(lines))["id"] == "case_two"
+            final = json.loads(await anext(lines))
+            assert final == {"status": "completed", "error": None}
+            with pytest.raises(StopAsyncIteration):
+                await anext(lines)
+        assert job["case_listeners"] == []
+    finally:
+        api_main._baseline_jobs.pop(job_id, None)
+
+
+@pytest.mark.anyio
+async def test_baseline_status_stream_ends_with_final_status(api_context):
+    """``GET /api/baseline/stream/{job_id}`` emits a final SSE update.
+
+    Scenario: the job already finished. The stream must emit exactly one
+    ``update`` frame carrying the completed status payload and then end
+    instead of holding the connection open.
+    """
+    from kernel.api import main as api_main
+
+    _app, _store, _settings = api_context
+    job_id = "test-status-stream-job"
+    job = _seed_baseline_job(api_main, job_id, status="completed")
+    job["completed_calls"] = 2
+    try:
+        frames = (await api_main.stream_baseline_status(job_id)).body_iterator
+        event, data = await _next_sse_frame(frames)
+        assert event == "update"
+        status = json.loads(data)
+        assert status["job_id"] == job_id
+        assert status["status"] == "completed"
+        assert status["completed_calls"] == 2
+        with pytest.raises(StopAsyncIteration):
+            await anext(frames)
+    finally:
+        api_main._baseline_jobs.pop(job_id, None)
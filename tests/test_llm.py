@@ -0,0 +1,253 @@
+"""Behavioral checks for the ``kernel.api.llm`` client stack.
+
+Everything runs against stubbed chat/embed callables so no Ollama
+backend is needed. Covered here:
+
+  * ``OllamaClient`` exact-cache and single-flight semantics — which
+    calls may be served from cache and which must reach the backend.
+  * ``OllamaClientPool`` failover — benching an endpoint on connection
+    failure and surfacing the last error when all endpoints are down.
+  * ``SemanticCachingLLMClient`` — near-duplicate hits, dissimilar
+    misses, and TTL expiry.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from kernel.api.llm import (
+    ChatCompletionResult,
+    ChatMessageIn,
+    OllamaClient,
+    OllamaClientPool,
+    SemanticCachingLLMClient,
+)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    """Pin the ``anyio`` pytest plugin to the ``asyncio`` backend."""
+    return "asyncio"
+
+
+def _stub_backend(client: OllamaClient, calls: list) -> None:
+    """Replace the HTTP layer with a counter that returns fresh results."""
+
+    async def _chat_request(messages, max_tokens=None, on_chunk=None, key=None):
+        calls.append([m.content for m in messages])
+        return ChatCompletionResult(
+            content=f"reply {len(calls)}",
+            latency_ms=5,
+            ttft_ms=1,
+            prompt_tokens=10,
+            completion_tokens=2,
+            total_tokens=12,
+        )
+
+    client._chat_request = _chat_request
+
+
+_MESSAGES = [
+    ChatMessageIn(role="system", content="system prompt"),
+    ChatMessageIn(role="user", content="deterministic payload"),
+]
+
+
+@pytest.mark.anyio
+async def test_identical_chat_is_served_from_exact_cache():
+    client = OllamaClient("http://localhost:11434", "test-model")
+    calls: list = []
+    _stub_backend(client, calls)
+
+    first = await client.chat(_MESSAGES, max_tokens=64)
+    second = await client.chat(_MESSAGES, max_tokens=64)
+
+    assert len(calls) == 1
+    assert second is first
+
+
+@pytest.mark.anyio
+async def test_use_cache_false_always_reaches_backend():
+    """Baseline-style repeat calls must never be replayed from cache.
+
+    A replayed ChatCompletionResult carries the original call's
+    latency_ms and token counts, which would silently corrupt baseline
+    measurements (a second identical run would report ~0 ms latencies).
+    """
+    client = OllamaClient("http://localhost:11434", "test-model")
+    calls: list = []
+    _stub_backend(client, calls)
+
+    first = await client.chat(_MESSAGES, max_tokens=64, use_cache=False)
+    second = await client.chat(_MESSAGES, max_tokens=64, use_cache=False)
+
+    assert len(calls) == 2
+    assert second is not first
+    # The bypass must not publish results either: a later cached caller
+    # should still miss and issue its own request.
+    assert not client._exact_cache
+    third = await client.chat(_MESSAGES, max_tokens=64)
+    assert len(calls) == 3
+    assert third is not second
+
+
+@pytest.mark.anyio
+async def test_cancelled_owner_does_not_cancel_coalesced_waiter():
+    """A client disconnect on the first caller must not kill duplicates.
+
+    The waiter coalesced onto the owner's in-flight future should fall
+    back to issuing its own request when the owner is cancelled, not be
+    cancelled along with it.
+    """
+    client = OllamaClient("http://localhost:11434", "test-model")
+    calls: list = []
+    release = asyncio.Event()
+
+    async def _chat_request(messages, max_tokens=None, on_chunk=None, key=None):
+        calls.append([m.content for m in messages])
+        await release.wait()
+        return ChatCompletionResult(
+            content=f"reply {len(calls)}",
+            latency_ms=5,
+            ttft_ms=1,
+            prompt_tokens=10,
+            completion_tokens=2,
+            total_tokens=12,
+        )
+
+    client._chat_request = _chat_request
+
+    owner = asyncio.create_task(client.chat(_MESSAGES, max_tokens=64))
+    await asyncio.sleep(0)  # owner registers its in-flight future
+    waiter = asyncio.create_task(client.chat(_MESSAGES, max_tokens=64))
+    await asyncio.sleep(0)  # waiter coalesces onto it
+
+    owner.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    result = await waiter
+    assert owner.cancelled()
+    assert result.content == "reply 2"
+    assert len(calls) == 2
+
+
+def _result(content: str) -> ChatCompletionResult:
+    return ChatCompletionResult(
+        content=content,
+        latency_ms=5,
+        ttft_ms=1,
+        prompt_tokens=10,
+        completion_tokens=2,
+        total_tokens=12,
+    )
+
+
+@pytest.mark.anyio
+async def test_pool_fails_over_and_cools_down_unhealthy_endpoint():
+    """A connection failure fails over and benches the endpoint.
+
+    The first endpoint raises a connection error, so the call must retry
+    on the second and succeed; the failed endpoint then sits on its
+    cooldown, so the next call skips it entirely.
+    """
+    pool = OllamaClientPool(["http://a:11434", "http://b:11434"], "test-model")
+    calls: list[str] = []
+
+    async def _fail(messages, max_tokens=None, on_chunk=None):
+        calls.append("a")
+        raise httpx.ConnectError("connection refused")
+
+    async def _succeed(messages, max_tokens=None, on_chunk=None):
+        calls.append("b")
+        return _result("from b")
+
+    pool._entries[0][0].chat = _fail
+    pool._entries[1][0].chat = _succeed
+
+    result = await pool.chat(_MESSAGES)
+    assert result.content == "from b"
+    assert calls == ["a", "b"]
+
+    await pool.chat(_MESSAGES)
+    assert calls == ["a", "b", "b"]
+
+
+@pytest.mark.anyio
+async def test_pool_raises_last_error_when_every_endpoint_fails():
+    pool = OllamaClientPool(["http://a:11434", "http://b:11434"], "test-model")
+
+    async def _fail(messages, max_tokens=None, on_chunk=None):
+        raise httpx.ConnectError("connection refused")
+
+    for client, _sem in pool._entries:
+        client.chat = _fail
+
+    with pytest.raises(httpx.ConnectError):
+        await pool.chat(_MESSAGES)
+
+
+class _StubEmbeddingClient:
+    """Maps exact query text to a fixed vector; no HTTP involved."""
+
+    def __init__(self, table: dict[str, list[float]]):
+        self._table = table
+
+    async def embed(self, text: str) -> list[float]:
+        return self._table[text]
+
+
+class _StubInnerClient:
+    def __init__(self):
+        self.calls: list[str] = []
+
+    async def chat(self, messages, max_tokens=None, on_chunk=None):
+        self.calls.append(messages[-1].content)
+        return _result(f"reply {len(self.calls)}")
+
+
+def _user(content: str) -> list[ChatMessageIn]:
+    return [ChatMessageIn(role="user", content=content)]
+
+
+_EMBEDDINGS = {
+    "what is python": [1.0, 0.0],
+    "what's python": [0.999, 0.045],
+    "unrelated question": [0.0, 1.0],
+}
+
+
+@pytest.mark.anyio
+async def test_semantic_cache_serves_near_duplicates_and_misses_unrelated():
+    """Near-duplicate prompts hit the cache; dissimilar ones go through.
+
+    The second query's stub embedding sits above the 0.95 cosine
+    threshold relative to the first, so it must be answered from cache
+    without an inner call; the unrelated third query must miss.
+    """
+    inner = _StubInnerClient()
+    cache = SemanticCachingLLMClient(inner, _StubEmbeddingClient(_EMBEDDINGS))
+
+    first = await cache.chat(_user("what is python"))
+    second = await cache.chat(_user("what's python"))
+    assert inner.calls == ["what is python"]
+    assert second.content == first.content
+
+    await cache.chat(_user("unrelated question"))
+    assert inner.calls == ["what is python", "unrelated question"]
+
+
+@pytest.mark.anyio
+async def test_semantic_cache_expires_entries_after_ttl():
+    """With an expired TTL an identical query reaches the model again."""
+    inner = _StubInnerClient()
+    cache = SemanticCachingLLMClient(
+        inner, _StubEmbeddingClient(_EMBEDDINGS), ttl_seconds=0.0
+    )
+
+    await cache.chat(_user("what is python"))
+    await cache.chat(_user("what is python"))
+    assert inner.calls == ["what is python", "what is python"]
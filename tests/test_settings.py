@@ -100,7 +100,14 @@ def test_get_settings_overrides(monkeypatch, tmp_path):
     monkeypatch.setenv("UPLOADS_DIR", str(uploads_dir))
     monkeypatch.setenv("MARKITDOWN_MCP_ENABLED", "false")
 
-    settings = get_settings()
+    # get_settings() memoizes the first environment read; drop any cached
+    # instance so the monkeypatched values are seen, and again afterwards so
+    # they do not leak into other tests.
+    get_settings.cache_clear()
+    try:
+        settings = get_settings()
+    finally:
+        get_settings.cache_clear()
 
     assert settings.aigent_version == "1.2.3-test"
     assert settings.aigent_tenant_id == "tenant-123"
@@ -82,6 +82,20 @@ def test_extract_visible_text_filters_think_blocks():
     assert extract_visible_text(text) == "Visible answer"
 
 
+@pytest.mark.p0
+@pytest.mark.bvt
+def test_extract_visible_text_filters_mixed_case_think_blocks():
+    """Mixed-case think tags are stripped too.
+
+    Scenario: a model emits ``<Think>``/``</THINK>`` with inconsistent
+    casing. The regexes are case-insensitive, so the fast-path substring
+    probe must be as well — a case-sensitive probe would return the text
+    unstripped and leak the reasoning block to the user.
+    """
+    assert extract_visible_text("<Think>secret</Think>visible") == "visible"
+    assert extract_visible_text("answer</THINK>") == "answer"
+
+
 @pytest.mark.p0
 def test_preview_and_token_helpers():
     """Preview truncation and the ~4-char-per-token estimator stay stable.